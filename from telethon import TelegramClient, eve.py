@@ -6,29 +6,62 @@ api_id = 23255624
 api_hash = "195b01ad28a4e39c07c790946c2c5366"
 session_name = "text_format_bot"
 
+# Emojis recognised by detect_text_format
+EMOJI_SET = frozenset("😀😁😂🤣😅😇😉😊😋😎😍😘🥰🤩🤔😐😶😏🙄😬😴😪😷🤒🤕🤢🤮🥵🥶🥴😵🤯")
+
 # ==== START CLIENT ====
 client = TelegramClient(session_name, api_id, api_hash)
 
-# ==== FUNCTION TO DETECT TEXT FORMAT ====
-def detect_text_format(text):
-    if text.isdigit():
+# ==== CHARACTER CLASS FLAGS ====
+HAS_DIGIT, HAS_ALPHA, HAS_UPPER, HAS_LOWER, HAS_EMOJI, HAS_NONSPACE, HAS_OTHER = 1, 2, 4, 8, 16, 32, 64
+# Titlecase letters (e.g. 'ǅ') are cased but neither upper nor lower, like str.isupper/islower treat them
+HAS_TITLE = 128
+
+def _describe_flags(flags):
+    kinds = flags & (HAS_DIGIT | HAS_ALPHA | HAS_OTHER)
+    if kinds == HAS_DIGIT:
         return "This text is a number 🔢"
-    elif text.isalpha():
-        if text.isupper():
+    elif kinds == HAS_ALPHA:
+        if flags & HAS_UPPER and not flags & (HAS_LOWER | HAS_TITLE):
             return "All uppercase letters 🔠"
-        elif text.islower():
+        elif flags & HAS_LOWER and not flags & (HAS_UPPER | HAS_TITLE):
             return "All lowercase letters 🔡"
         else:
             return "Alphabetic mixed case 📝"
-    elif any(char.isdigit() for char in text) and any(char.isalpha() for char in text):
+    elif flags & HAS_DIGIT and flags & HAS_ALPHA:
         return "Alphanumeric (letters + numbers) 🔣"
-    elif text.strip() == "":
+    elif not flags & HAS_NONSPACE:
         return "Blank or whitespace 🕳️"
-    elif any(char in "😀😁😂🤣😅😇😉😊😋😎😍😘🥰🤩🤔😐😶😏🙄😬😴😪😷🤒🤕🤢🤮🥵🥶🥴😵🤯" for char in text):
+    elif flags & HAS_EMOJI:
         return "Contains emojis 😁"
     else:
         return "General text or sentence 💬"
 
+# Description for every flag combination, indexed by flags
+FORMAT_RESULTS = tuple(_describe_flags(flags) for flags in range(256))
+
+# ==== FUNCTION TO DETECT TEXT FORMAT ====
+def detect_text_format(text):
+    flags = 0
+    for char in text:
+        if char.isdigit():
+            flags |= HAS_DIGIT
+        elif char.isalpha():
+            flags |= HAS_ALPHA
+            if char.isupper():
+                flags |= HAS_UPPER
+            elif char.islower():
+                flags |= HAS_LOWER
+            elif char.istitle():
+                flags |= HAS_TITLE
+        else:
+            flags |= HAS_OTHER
+            if char in EMOJI_SET:
+                flags |= HAS_EMOJI
+        if not char.isspace():
+            flags |= HAS_NONSPACE
+    return FORMAT_RESULTS[flags]
+
 # ==== MESSAGE HANDLER (your own messages only) ====
 @client.on(events.NewMessage(outgoing=True))
 async def handler(event):
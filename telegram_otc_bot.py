@@ -5,17 +5,31 @@ Monitors OTC pairs and sends trading signals via Telegram
 """
 
 import os
+import math
 import time
+import random
 import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
 
+import numpy as np
 from telegram import Bot
+from telegram.request import HTTPXRequest
 from dotenv import load_dotenv
 
+try:
+    from pyrogram import Client
+except ImportError:  # MTProto transport is optional
+    Client = None
+
+try:
+    from numba import njit
+except ImportError:  # Scoring falls back to plain NumPy
+    njit = None
+
 # Import from existing PyQuotex API
+from pyquotex import global_value
 from pyquotex.stable_api import Quotex
 
 # Load environment variables
@@ -28,14 +42,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
-class CandleData:
-    """Candle data structure"""
-    open: float
-    high: float
-    low: float
-    close: float
-    timestamp: int
+# Candle record layout; a pair's candles are a 1-D array of this dtype
+CANDLE_DTYPE = np.dtype([
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('timestamp', 'i8')
+])
+
+
+def _score_kernel_numpy(o, h, l, c):
+    """
+    Score (n_pairs, n_candles) price matrices
+    Returns: (scores, directions as +1 CALL / -1 PUT, volatility)
+    """
+    changes = c - o
+    dirs = np.sign(changes)
+    same = (dirs == dirs[:, :1]).all(axis=1) & (dirs[:, 0] != 0)
+    momentum = (0.6 * changes[:, -1]) + (0.4 * changes[:, -2])
+    volatility = (h - l).mean(axis=1)
+    
+    # High score for reversal pattern, momentum * volatility otherwise
+    scores = np.where(same, 100.0, np.abs(momentum) * volatility)
+    # Reversal goes against the run; momentum ties resolve to PUT
+    directions = np.where(same, -dirs[:, 0], np.where(momentum > 0, 1.0, -1.0))
+    return scores, directions, volatility
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _score_kernel(o, h, l, c):
+        """Compiled equivalent of _score_kernel_numpy"""
+        n, k = o.shape
+        scores = np.empty(n)
+        directions = np.empty(n)
+        volatility = np.empty(n)
+        for i in range(n):
+            d0 = np.sign(c[i, 0] - o[i, 0])
+            same = d0 != 0
+            vol = 0.0
+            for j in range(k):
+                if np.sign(c[i, j] - o[i, j]) != d0:
+                    same = False
+                vol += h[i, j] - l[i, j]
+            vol /= k
+            volatility[i] = vol
+            if same:
+                scores[i] = 100.0
+                directions[i] = -d0
+            else:
+                momentum = 0.6 * (c[i, k - 1] - o[i, k - 1]) + 0.4 * (c[i, k - 2] - o[i, k - 2])
+                scores[i] = abs(momentum) * vol
+                directions[i] = 1.0 if momentum > 0 else -1.0
+        return scores, directions, volatility
+else:
+    _score_kernel = _score_kernel_numpy
+
+class RateLimiter:
+    """Token bucket allowing `rate` acquisitions per `period` seconds"""
+    
+    def __init__(self, rate: int, period: float = 1.0):
+        # A zero rate would divide by zero on every acquire, which callers only see as failed fetches
+        if rate < 1 or period <= 0:
+            raise ValueError(f"RateLimiter needs rate >= 1 and period > 0, got rate={rate}, period={period}")
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.rate / self.period
+                self._tokens = min(float(self.rate), self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
 
 class TelegramOTCBot:
     """Main bot class for OTC trading signals"""
@@ -84,10 +175,81 @@ class TelegramOTCBot:
         "XAUUSD_otc": "Gold (OTC)"
     }
     
+    # Display names used in signal messages
+    PAIR_DISPLAY = {k: v.replace(" (OTC)", "-OTC") for k, v in PAIR_NAMES.items()}
+    
+    # Message templates
+    _SIGNAL_TMPL = (
+        "╭━━━━━━━━━━・━━━━━━━━━━╮\n"
+        "🐲 OPEN PAIR -» {name}\n"
+        "🕓 TIMETABLE -» {time}\n"
+        "⏳ EXPIRATION-» M1\n"
+        "{emoji} DIRECTION -» {direction}\n"
+        "📶 PRICE     -» {price:.4f}\n"
+        "╰━━━━━━━━━━・━━━━━━━━━━╯"
+    )
+    _MTG_TMPL = (
+        "╭━━━━━━━━━━・━━━━━━━━━━╮\n"
+        "🔥 MTG TRADE -» {name}\n"
+        "🕓 TIMETABLE -» {time}\n"
+        "⏳ EXPIRATION-» M1\n"
+        "{emoji} DIRECTION -» {direction}\n"
+        "💰 STAKE     -» {stake:.1f}x\n"
+        "╰━━━━━━━━━━・━━━━━━━━━━╯"
+    )
+    _RESULT_TMPLS = {
+        "WIN": (
+            "╭━━━━━━━━━━・━━━━━━━━━━╮\n"
+            "✅✅  SURESHOT  ✅✅\n"
+            "\n"
+            "WIN :- {wins:02d} OTM :- {losses:02d}\n"
+            "╰━━━━━━━━━━・━━━━━━━━━━╯"
+        ),
+        "MTG WIN": (
+            "╭━━━━━━━━━━・━━━━━━━━━━╮\n"
+            "✅✅  MTG WIN  ✅✅\n"
+            "\n"
+            "WIN :- {wins:02d} OTM :- {losses:02d}\n"
+            "╰━━━━━━━━━━・━━━━━━━━━━╯"
+        ),
+        "LOSS": (
+            "╭━━━━━━━━━━・━━━━━━━━━━╮\n"
+            "❌❌  LOSS  ❌❌\n"
+            "\n"
+            "WIN :- {wins:02d} OTM :- {losses:02d}\n"
+            "╰━━━━━━━━━━・━━━━━━━━━━╯"
+        ),
+    }
+    
+    # Seconds to wait for a Quotex candle response
+    QUOTEX_TIMEOUT = 15
+    # Candle cache: entry cap, age (s) at which entries are evicted, and how long (s)
+    # a window fetched before its last candle closed is reused
+    CANDLE_CACHE_SIZE = 512
+    CANDLE_CACHE_MAX_AGE = 180
+    CANDLE_CACHE_TTL = 10
+    
+    # Telegram batching: flush interval (s), messages per flush, queued message cap, API text limit
+    TG_FLUSH_INTERVAL = 3.0
+    TG_MAX_BATCH = 20
+    TG_QUEUE_SIZE = 100
+    TG_MAX_MESSAGE_LENGTH = 4096
+    TG_CONNECTION_POOL_SIZE = 16
+    
+    # Delay after candle close before reading its result (s)
+    CANDLE_CLOSE_BUFFER = 5
+    
+    # Seconds between scan starts, and cap on concurrently running signal sequences
+    SCAN_INTERVAL = 60
+    MAX_OPEN_TRADES = 16
+    
     def __init__(self):
         self.telegram_token = os.getenv('TELEGRAM_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        self.bot: Optional[Bot] = None
+        self.api_id = os.getenv('TELEGRAM_API_ID')
+        self.api_hash = os.getenv('TELEGRAM_API_HASH')
+        self.bot = None  # telegram.Bot, or pyrogram Client when MTProto is used
+        self.use_mtproto = False
         self.quotex_client: Optional[Quotex] = None
         self.last_signal_time = 0
         self.min_volatility_threshold = 0.00001  # Lower threshold for more pairs
@@ -96,24 +258,73 @@ class TelegramOTCBot:
         
         # Martingale state variables
         self.base_stake = 1.0  # Initial stake amount
-        self.current_stake = 1.0  # Current trade stake
         self.martingale_factor = 2.0  # Multiplier for MTG trades
-        self.in_martingale_sequence = False  # Track if in MTG sequence
+        
+        # Reconnect circuit breaker
+        self._reconnect_failures = 0
+        self._breaker_open_until = 0.0
+        
+        # Running signal sequences, one evaluation task per pair
+        self._open_trades: Dict[str, asyncio.Task] = {}
+        
+        # Quotex.get_candles keeps a single response slot, so requests must not interleave
+        self._quotex_lock = asyncio.Lock()
+        # Candle requests per second sent to Quotex
+        self._quotex_throttle = RateLimiter(int(os.getenv('QX_RATE', 10)), period=1.0)
+        
+        # Outgoing Telegram messages, drained in batches by the flusher task
+        self._tg_queue: asyncio.Queue = asyncio.Queue(maxsize=self.TG_QUEUE_SIZE)
+        self._flusher: Optional[asyncio.Task] = None
+        
+        # Fetched windows keyed by (pair, minute of the window's last candle, limit) as
+        # (fetch time, candles), least recently used first
+        self._candle_cache: Dict[Tuple[str, int, int], Tuple[float, np.ndarray]] = {}
+        
+        # Signal log stays open for the bot's lifetime (line buffered)
+        self._log_fp = None
+        try:
+            self._log_fp = open("signals.log", "a", buffering=1, encoding="utf-8")
+        except OSError as e:
+            logger.error(f"Failed to open signal log: {e}")
         
         # Initialize Telegram bot if token provided
-        if self.telegram_token:
-            self.bot = Bot(token=self.telegram_token)
+        if self.telegram_token and self.api_id and self.api_hash and Client:
+            # Persistent MTProto session (crypto is C-accelerated when tgcrypto is installed)
+            self.use_mtproto = True
+            self.bot = Client(
+                "otcbot",
+                api_id=int(self.api_id),
+                api_hash=self.api_hash,
+                bot_token=self.telegram_token,
+                no_updates=True
+            )
+            # Pyrogram expects numeric chat ids as int
+            if self.chat_id and self.chat_id.lstrip('-').isdigit():
+                self.chat_id = int(self.chat_id)
+        elif self.telegram_token:
+            # Single pooled HTTP/2 client, so connections and TLS sessions are reused
+            self.bot = Bot(
+                token=self.telegram_token,
+                request=HTTPXRequest(
+                    connection_pool_size=self.TG_CONNECTION_POOL_SIZE,
+                    http_version="2"
+                )
+            )
         else:
             logger.warning("No Telegram token provided - signals will be logged only")
     
-    async def init_quotex(self) -> bool:
-        """Initialize Quotex connection with retry logic"""
-        max_retries = 3
+    async def init_quotex(self, max_retries: int = 3) -> bool:
+        """Initialize Quotex connection with jittered exponential backoff"""
         retry_delay = 5
         
         for attempt in range(max_retries):
             try:
-                self.quotex_client = Quotex()
+                # The client persists its session in session.json and only logs in when
+                # no saved token exists, so keep one instance across (re)connects
+                if not self.quotex_client:
+                    self.quotex_client = Quotex()
+                if self.quotex_client.session_data.get("token"):
+                    logger.info("Reusing saved Quotex session")
                 success, reason = await self.quotex_client.connect()
                 
                 if success:
@@ -126,151 +337,263 @@ class TelegramOTCBot:
                 logger.error(f"Connection attempt {attempt + 1} failed: {e}")
                 
             if attempt < max_retries - 1:
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                await asyncio.sleep(retry_delay)
+                # Jitter spreads out retries so reconnects don't arrive in lockstep
+                delay = retry_delay * random.uniform(0.5, 1.5)
+                logger.info(f"Retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
                 retry_delay *= 2  # Exponential backoff
         
         return False
     
-    async def get_candles_for_pair(self, pair: str, limit: int = 4) -> Optional[List[CandleData]]:
-        """Fetch recent candles for a pair"""
+    async def get_candles_for_pair(self, pair: str, limit: int = 4,
+                                   end_time: Optional[float] = None,
+                                   use_cache: bool = True) -> Optional[np.ndarray]:
+        """Fetch the last `limit` candles ending at end_time (default: now), served from the cache when possible"""
         try:
-            if not self.quotex_client:
+            now = time.time()
+            if end_time is None:
+                end_time = now
+            
+            # Evict windows older than CANDLE_CACHE_MAX_AGE
+            self._candle_cache = {
+                k: v for k, v in self._candle_cache.items() if now - v[0] <= self.CANDLE_CACHE_MAX_AGE
+            }
+            # Candles opening before end_time are returned, so this is the minute the last one opens in
+            key = (pair, (math.ceil(end_time) - 1) // 60, limit)
+            if use_cache:
+                cached = self._candle_cache.pop(key, None)
+                if cached is not None:
+                    fetched_at, candles = cached
+                    # Final if the last candle had closed when fetched; otherwise only while fresh
+                    if fetched_at >= (key[1] + 1) * 60 or now - fetched_at <= self.CANDLE_CACHE_TTL:
+                        self._candle_cache[key] = cached
+                        return candles
+            
+            if not self._quotex_connected():
                 return None
             
             # Fetch candles using existing API (60 seconds = 1 minute)
-            end_time = time.time()
             offset = limit * 60  # 60 seconds per candle
             
-            candles_raw = await self.quotex_client.get_candles(
-                asset=pair,
-                end_from_time=end_time,
-                offset=offset,
-                period=60  # 1 minute candles
-            )
+            async with self._quotex_throttle, self._quotex_lock:
+                # Checked under the lock: a fetch that timed out ahead of this one drops the session
+                if not self._quotex_connected():
+                    return None
+                try:
+                    # Quotex.get_candles polls forever if the socket drops mid-request
+                    candles_raw = await asyncio.wait_for(
+                        self.quotex_client.get_candles(
+                            asset=pair,
+                            end_from_time=end_time,
+                            offset=offset,
+                            period=60  # 1 minute candles
+                        ),
+                        timeout=self.QUOTEX_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    # The abandoned request can still be answered into the client's single
+                    # candle slot; close the socket so no later fetch reads that response
+                    logger.warning(f"Timed out fetching candles for {pair}, dropping the Quotex session")
+                    await self._drop_session()
+                    return None
             
+            # Candles opening at or after end_time lie outside the requested window
+            candles_raw = [c for c in candles_raw or [] if c.get('time', 0) < end_time]
             if not candles_raw:
                 return None
             
-            # Convert to CandleData objects
-            candles = []
-            for candle in candles_raw[-limit:]:  # Get last N candles
-                candles.append(CandleData(
-                    open=float(candle.get('open', 0)),
-                    high=float(candle.get('high', 0)),
-                    low=float(candle.get('low', 0)),
-                    close=float(candle.get('close', 0)),
-                    timestamp=int(candle.get('time', 0))
-                ))
+            # Parse the last N candles straight into a CANDLE_DTYPE array
+            window = candles_raw[-limit:]
+            candles = np.fromiter(
+                (
+                    (c.get('open', 0), c.get('high', 0), c.get('low', 0), c.get('close', 0), c.get('time', 0))
+                    for c in window
+                ),
+                dtype=CANDLE_DTYPE,
+                count=len(window)
+            )
             
+            self._candle_cache[key] = (now, candles)
+            if len(self._candle_cache) > self.CANDLE_CACHE_SIZE:
+                del self._candle_cache[next(iter(self._candle_cache))]
             return candles
             
         except Exception as e:
             logger.error(f"Error fetching candles for {pair}: {e}")
             return None
     
-    def score_pair(self, candles: List[CandleData]) -> Tuple[float, str, float]:
+    def _quotex_connected(self) -> bool:
         """
-        New reversal logic: if last 4 candles are same direction, predict reversal
+        Websocket state kept by pyquotex's ws client
+        Quotex.check_connect() only reflects authorization, which is not cleared when the socket drops
+        """
+        return self.quotex_client is not None and global_value.check_websocket_if_connect == 1
+    
+    async def _drop_session(self):
+        """Close the Quotex socket; reconnect_if_needed opens a new one before the next scan"""
+        try:
+            await self.quotex_client.close()
+        except Exception as e:
+            logger.error(f"Error closing Quotex session: {e}")
+        # Marked down even if close() failed
+        global_value.check_websocket_if_connect = 0
+    
+    def score_pairs(self, candle_sets: List[np.ndarray]) -> List[Tuple[float, str, float, float]]:
+        """
+        Vectorized scoring of several pairs in one pass; every set must have the same length
+        Reversal logic: if all candles are same direction, predict reversal
+        Otherwise: momentum of the last two candles weighted by volatility
+        Returns: list of (direction_score, direction, last_price, volatility)
+        """
+        if not candle_sets:
+            return []
+        
+        # (n_pairs, n_candles) price matrices
+        stacked = np.stack(candle_sets)
+        o, h, l, c = (np.ascontiguousarray(stacked[field]) for field in ('open', 'high', 'low', 'close'))
+        
+        scores, directions, volatility = _score_kernel(o, h, l, c)
+        
+        return [
+            (float(score), "CALL" if direction > 0 else "PUT", float(price), float(vol))
+            for score, direction, price, vol in zip(scores, directions, c[:, -1], volatility)
+        ]
+    
+    def score_pair(self, candles: np.ndarray) -> Tuple[float, str, float]:
+        """
+        Score a single pair
         Returns: (direction_score, direction, last_price)
         """
         if len(candles) < 4:
             return 0.0, "NONE", 0.0
         
-        # Check last 4 candles direction
-        directions = []
-        for candle in candles:
-            if candle.close > candle.open:
-                directions.append("CALL")
-            elif candle.close < candle.open:
-                directions.append("PUT")
-            else:
-                directions.append("NEUTRAL")
-        
-        # Check if last 4 candles are same direction
-        if len(set(directions)) == 1 and directions[0] != "NEUTRAL":
-            # Reversal signal - opposite of last 4 candles
-            direction = "PUT" if directions[0] == "CALL" else "CALL"
-            # High score for reversal pattern
-            direction_score = 100.0
-        else:
-            # Regular momentum logic
-            candle_changes = [c.close - c.open for c in candles]
-            momentum = (0.6 * candle_changes[-1]) + (0.4 * candle_changes[-2])
-            volatility = sum(c.high - c.low for c in candles) / len(candles)
-            direction_score = abs(momentum) * volatility
-            direction = "CALL" if momentum > 0 else "PUT"
-        
-        return direction_score, direction, candles[-1].close
+        direction_score, direction, price, _ = self.score_pairs([candles])[0]
+        return direction_score, direction, price
     
-    async def analyze_single_pair(self, pair: str) -> Optional[Tuple[str, str, float, float]]:
+    def analyze_pairs(
+        self, fetched: List[Tuple[str, Optional[np.ndarray]]]
+    ) -> List[Tuple[str, Optional[Tuple[str, str, float, float]]]]:
         """
-        Analyze a single pair for signal
-        Returns: (pair, direction, score, price) or None
+        Analyze fetched pairs for signals in a single batch
+        Returns: list of (pair, (pair, direction, score, price) or None) in input order
         """
+        scorable = [(pair, candles[-4:]) for pair, candles in fetched
+                    if candles is not None and len(candles) >= 4]
+        scored = dict(zip(
+            (pair for pair, _ in scorable),
+            self.score_pairs([candles for _, candles in scorable])
+        ))
+        
+        results = []
+        for pair, _ in fetched:
+            entry = scored.get(pair)
+            # Filter out missing data and low volatility pairs
+            if entry is None or entry[3] < self.min_volatility_threshold:
+                results.append((pair, None))
+                continue
+            score, direction, price, _ = entry
+            results.append((pair, (pair, direction, score, price)))
+        return results
+    
+    async def _scan_pair(self, pair: str) -> Tuple[str, Optional[np.ndarray]]:
+        """
+        Fetch candles for a pair; the Quotex lock runs one request at a time
+        Returns: (pair, candles or None)
+        """
+        logger.info(f"Analyzing pair: {pair}")
         candles = await self.get_candles_for_pair(pair, 4)
-        if not candles:
-            return None
-        
-        score, direction, price = self.score_pair(candles)
+        return pair, candles
+    
+    async def _refresh_signal(self, pair: str) -> Optional[Tuple[str, str, float, float]]:
+        """
+        Re-score a pair on candles at most CANDLE_CACHE_TTL old before its signal is sent
+        Fetches are serialized, so early pairs in a long scan would otherwise signal on old prices;
+        the candle cache answers while the scan's candles are still fresh
+        """
+        return self.analyze_pairs([await self._scan_pair(pair)])[0][1]
+    
+    async def _sleep_until(self, target: float):
+        """Sleep until the given wall-clock timestamp"""
+        await asyncio.sleep(max(0.0, target - time.time()))
+    
+    async def _trade_sequence(self, pair: str, direction: str, price: float, entry_ts: int):
+        """Send a signal for the candle opening at entry_ts and evaluate its result"""
+        time_str = datetime.fromtimestamp(entry_ts).strftime("%H:%M")
+        message = self.format_message(pair, direction, price, time_str)
+        
+        # Send signal
+        if not await self.send_telegram(message):
+            logger.error(f"Failed to send signal for {pair}")
+            return
+        logger.info(f"Signal sent for {pair} - {direction} at {price}")
         
-        # Filter out low volatility pairs
-        volatility = sum(c.high - c.low for c in candles) / len(candles)
-        if volatility < self.min_volatility_threshold:
-            return None
+        # Log signal
+        signal_log = f"{pair} {direction} signal at {price}"
+        self.log_signal(signal_log)
         
-        return (pair, direction, score, price)
+        # Evaluate result (this will take ~2 minutes)
+        await self.evaluate_signal_result(pair, direction, entry_ts)
+    
+    def _start_trade_sequence(self, pair: str, direction: str, price: float, entry_ts: int):
+        """Run a pair's signal sequence as its own task so scanning can continue"""
+        task = asyncio.create_task(self._trade_sequence(pair, direction, price, entry_ts))
+        self._open_trades[pair] = task
+        task.add_done_callback(lambda t: self._on_trade_done(pair, t))
     
-    async def evaluate_signal_result(self, pair: str, direction: str):
+    def _on_trade_done(self, pair: str, task: asyncio.Task):
+        """Release the pair and report a failed sequence"""
+        self._open_trades.pop(pair, None)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Error evaluating signal for {pair}: {task.exception()}")
+    
+    async def evaluate_signal_result(self, pair: str, direction: str, entry_candle_ts: int):
         """
         Enhanced M1 Martingale Sequence Logic
         Phase 1: Initial Trade (T) - Entry at T, Expiry at T+60s
         Phase 2: MTG Trade (T+1) - Entry at T+60s, Expiry at T+120s (if Phase 1 loses)
+        T is entry_candle_ts, the minute shown in the signal's TIMETABLE
         """
-        # Reset Martingale state for new sequence
-        self.current_stake = self.base_stake
-        self.in_martingale_sequence = True
         
         # PHASE 1: Initial Trade (Candle T)
-        initial_entry_time = datetime.now()
-        initial_timestamp = int(time.time())
+        stake = self.base_stake
+        initial_entry_time = datetime.fromtimestamp(entry_candle_ts)
         
         logger.info(f"=== PHASE 1: Initial Trade ===")
-        logger.info(f"Entry: {initial_entry_time.strftime('%H:%M:%S')} | {pair} {direction} | Stake: {self.current_stake}")
+        logger.info(f"Entry: {initial_entry_time.strftime('%H:%M:%S')} | {pair} {direction} | Stake: {stake}")
         
         # Wait for initial trade candle to close (T + 60s)
-        await asyncio.sleep(65)  # 60s + 5s buffer
+        await self._sleep_until(entry_candle_ts + 60 + self.CANDLE_CLOSE_BUFFER)
         
         # Get initial trade result
-        initial_result = await self.check_trade_result(pair, direction, initial_timestamp)
+        initial_result = await self.check_trade_result(pair, direction, entry_candle_ts)
         
         if initial_result == "WIN":
             # Phase 1 WIN - Sequence complete
             result = "WIN"
             self.win_count += 1
-            self.in_martingale_sequence = False
-            self.current_stake = self.base_stake
             logger.info(f"SEQUENCE COMPLETE: Initial WIN")
         else:
             # Phase 1 LOSS - Proceed to Martingale
             logger.info(f"=== PHASE 2: Martingale Trade ===")
             
-            # Update stake for MTG trade
-            self.current_stake = self.base_stake * self.martingale_factor
-            mtg_entry_time = datetime.now()
-            mtg_timestamp = int(time.time())
+            # Update stake for MTG trade on the following candle
+            stake = self.base_stake * self.martingale_factor
+            mtg_candle_ts = entry_candle_ts + 60
+            mtg_entry_time = datetime.fromtimestamp(mtg_candle_ts)
             
-            logger.info(f"MTG Entry: {mtg_entry_time.strftime('%H:%M:%S')} | {pair} {direction} | Stake: {self.current_stake}")
+            logger.info(f"MTG Entry: {mtg_entry_time.strftime('%H:%M:%S')} | {pair} {direction} | Stake: {stake}")
             
             # Send MTG signal notification
-            mtg_message = self.format_mtg_message(pair, direction, self.current_stake)
+            mtg_message = self.format_mtg_message(
+                pair, direction, stake, mtg_entry_time.strftime("%H:%M")
+            )
             await self.send_telegram(mtg_message)
             
             # Wait for MTG trade candle to close (T + 120s total)
-            await asyncio.sleep(65)  # 60s + 5s buffer
+            await self._sleep_until(mtg_candle_ts + 60 + self.CANDLE_CLOSE_BUFFER)
             
             # Get MTG trade result
-            mtg_result = await self.check_trade_result(pair, direction, mtg_timestamp)
+            mtg_result = await self.check_trade_result(pair, direction, mtg_candle_ts)
             
             if mtg_result == "WIN":
                 # MTG WIN - Sequence complete
@@ -282,10 +605,6 @@ class TelegramOTCBot:
                 result = "LOSS"
                 self.loss_count += 1
                 logger.info(f"SEQUENCE COMPLETE: TOTAL LOSS")
-            
-            # Reset Martingale state
-            self.in_martingale_sequence = False
-            self.current_stake = self.base_stake
         
         # Send final result
         result_message = self.format_result_message(result)
@@ -299,23 +618,26 @@ class TelegramOTCBot:
         Check M1 trade result for specific candle
         Returns: "WIN" or "LOSS"
         """
-        candles = await self.get_candles_for_pair(pair, 2)
-        if not candles:
+        # Only the trade candle is needed: request the single candle ending at its close.
+        # A candle still forming in the current minute is never served from the cache
+        candles = await self.get_candles_for_pair(
+            pair, 1, end_time=entry_timestamp + 60,
+            use_cache=entry_timestamp < int(time.time()) // 60 * 60
+        )
+        if candles is None or len(candles) == 0:
             logger.error(f"Failed to get candles for {pair}")
             return "LOSS"
         
-        # Find correct candle by timestamp
-        trade_candle = None
-        for candle in candles:
-            if abs(candle.timestamp - entry_timestamp) <= 60:
-                trade_candle = candle
-                break
-        
-        if not trade_candle:
-            trade_candle = candles[-1]
+        # Binary search the window for the candle opening at entry_timestamp; grading
+        # whichever candle came back last would score the wrong minute
+        idx = int(np.searchsorted(candles['timestamp'], entry_timestamp))
+        if idx == len(candles) or candles[idx]['timestamp'] != entry_timestamp:
+            logger.error(f"Trade candle for {pair} missing from the fetched window")
+            return "LOSS"
+        trade_candle = candles[idx]
         
-        entry_price = trade_candle.open
-        close_price = trade_candle.close
+        entry_price = float(trade_candle['open'])
+        close_price = float(trade_candle['close'])
         
         logger.info(f"Candle: Open={entry_price:.5f}, Close={close_price:.5f}")
         
@@ -327,64 +649,35 @@ class TelegramOTCBot:
         
         return "WIN" if is_win else "LOSS"
     
-    def format_mtg_message(self, pair: str, direction: str, stake: float) -> str:
+    def format_mtg_message(self, pair: str, direction: str, stake: float,
+                           time_str: Optional[str] = None) -> str:
         """
         Format MTG signal message
+        time_str defaults to the next minute boundary
         """
-        readable_name = self.PAIR_NAMES.get(pair, pair).replace(" (OTC)", "-OTC")
-        next_minute = datetime.now().replace(second=0, microsecond=0) + timedelta(minutes=1)
-        time_str = next_minute.strftime("%H:%M")
-        direction_emoji = "🔴" if direction == "PUT" else "🟢"
-        
-        return f"""╭━━━━━━━━━━・━━━━━━━━━━╮
-🔥 MTG TRADE -» {readable_name}
-🕓 TIMETABLE -» {time_str}
-⏳ EXPIRATION-» M1
-{direction_emoji} DIRECTION -» {direction}
-💰 STAKE     -» {stake:.1f}x
-╰━━━━━━━━━━・━━━━━━━━━━╯"""
-    
-    def format_message(self, pair: str, direction: str, price: float) -> str:
-        """Format the Telegram message with custom styling"""
-        readable_name = self.PAIR_NAMES.get(pair, pair).replace(" (OTC)", "-OTC")
-        next_minute = datetime.now().replace(second=0, microsecond=0) + timedelta(minutes=1)
-        time_str = next_minute.strftime("%H:%M")
-        
-        # Direction emoji
-        direction_emoji = "🔴" if direction == "PUT" else "🟢"
-        
-        message = f"""╭━━━━━━━━━━・━━━━━━━━━━╮
-🐲 OPEN PAIR -» {readable_name}
-🕓 TIMETABLE -» {time_str}
-⏳ EXPIRATION-» M1
-{direction_emoji} DIRECTION -» {direction}
-📶 PRICE     -» {price:.4f}
-╰━━━━━━━━━━・━━━━━━━━━━╯"""
-        
-        return message
+        return self._MTG_TMPL.format(
+            name=self.PAIR_DISPLAY.get(pair, pair),
+            time=time_str or self._next_minute_str(),
+            emoji="🔴" if direction == "PUT" else "🟢",
+            direction=direction,
+            stake=stake
+        )
+    
+    def format_message(self, pair: str, direction: str, price: float,
+                       time_str: Optional[str] = None) -> str:
+        """Format the Telegram message with custom styling; time_str defaults to the next minute"""
+        return self._SIGNAL_TMPL.format(
+            name=self.PAIR_DISPLAY.get(pair, pair),
+            time=time_str or self._next_minute_str(),
+            emoji="🔴" if direction == "PUT" else "🟢",
+            direction=direction,
+            price=price
+        )
     
     def format_result_message(self, result: str) -> str:
         """Format the result message with custom styling"""
-        if result == "WIN":
-            message = f"""╭━━━━━━━━━━・━━━━━━━━━━╮
-✅✅  SURESHOT  ✅✅
-
-WIN :- {self.win_count:02d} OTM :- {self.loss_count:02d}
-╰━━━━━━━━━━・━━━━━━━━━━╯"""
-        elif result == "MTG WIN":
-            message = f"""╭━━━━━━━━━━・━━━━━━━━━━╮
-✅✅  MTG WIN  ✅✅
-
-WIN :- {self.win_count:02d} OTM :- {self.loss_count:02d}
-╰━━━━━━━━━━・━━━━━━━━━━╯"""
-        else:  # LOSS
-            message = f"""╭━━━━━━━━━━・━━━━━━━━━━╮
-❌❌  LOSS  ❌❌
-
-WIN :- {self.win_count:02d} OTM :- {self.loss_count:02d}
-╰━━━━━━━━━━・━━━━━━━━━━╯"""
-        
-        return message
+        template = self._RESULT_TMPLS.get(result, self._RESULT_TMPLS["LOSS"])
+        return template.format(wins=self.win_count, losses=self.loss_count)
     
     async def test_telegram(self) -> bool:
         """Test Telegram bot connection"""
@@ -402,7 +695,10 @@ WIN :- {self.win_count:02d} OTM :- {self.loss_count:02d}
             return False
     
     async def send_telegram(self, message: str) -> bool:
-        """Send message via Telegram"""
+        """
+        Queue message for the next batched Telegram send
+        Returns False if the queue is full; the message then only reaches the console and file
+        """
         if not self.bot or not self.chat_id:
             # Log to console and file if no Telegram config
             print(f"\n{message}\n")
@@ -410,103 +706,163 @@ WIN :- {self.win_count:02d} OTM :- {self.loss_count:02d}
             return True
         
         try:
-            await self.bot.send_message(chat_id=self.chat_id, text=message)
-            logger.info("Signal sent via Telegram")
+            self._tg_queue.put_nowait(message)
             return True
-        except Exception as e:
-            logger.error(f"Failed to send Telegram message: {e}")
-            # Fallback to console/file logging
+        except asyncio.QueueFull:
+            logger.warning("Telegram queue full, message logged to file only")
             print(f"\n{message}\n")
             self.log_signal(message)
             return False
     
+    def _pack_messages(self, messages: List[str]) -> List[str]:
+        """Join messages into as few payloads as fit the Telegram length limit"""
+        payloads = []
+        current = ""
+        for message in messages:
+            if current and len(current) + 2 + len(message) > self.TG_MAX_MESSAGE_LENGTH:
+                payloads.append(current)
+                current = message
+            else:
+                current = f"{current}\n\n{message}" if current else message
+        if current:
+            payloads.append(current)
+        return payloads
+    
+    async def _flush_telegram(self):
+        """Send up to TG_MAX_BATCH queued messages, preserving their order"""
+        batch = []
+        while len(batch) < self.TG_MAX_BATCH:
+            try:
+                batch.append(self._tg_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        
+        for payload in self._pack_messages(batch):
+            try:
+                await self.bot.send_message(chat_id=self.chat_id, text=payload)
+                logger.info("Signal sent via Telegram")
+            except Exception as e:
+                logger.error(f"Failed to send Telegram message: {e}")
+                # Fallback to console/file logging
+                print(f"\n{payload}\n")
+                self.log_signal(payload)
+    
+    async def _flush_loop(self):
+        """Background task flushing the Telegram queue every TG_FLUSH_INTERVAL"""
+        while True:
+            await asyncio.sleep(self.TG_FLUSH_INTERVAL)
+            await self._flush_telegram()
+    
     def log_signal(self, message: str):
         """Log signal to file"""
+        if not self._log_fp:
+            return
         try:
-            with open("signals.log", "a", encoding="utf-8") as f:
-                f.write(f"{datetime.now().isoformat()} - {message}\n\n")
+            self._log_fp.write(f"{datetime.now().isoformat()} - {message}\n\n")
         except Exception as e:
             logger.error(f"Failed to log signal: {e}")
     
-    def get_next_candle_time(self) -> datetime:
+    def get_next_candle_time(self, now: Optional[datetime] = None) -> datetime:
         """Get the next minute boundary"""
-        now = datetime.now()
+        now = now or datetime.now()
         return now.replace(second=0, microsecond=0) + timedelta(minutes=1)
     
+    def _next_minute_str(self, now: Optional[datetime] = None) -> str:
+        """Next minute boundary as shown in signal messages"""
+        return self.get_next_candle_time(now).strftime("%H:%M")
+    
     def get_signal_send_time(self) -> datetime:
         """Get time to send signal (30 seconds before next candle)"""
         next_candle = self.get_next_candle_time()
         return next_candle - timedelta(seconds=30)
     
     async def reconnect_if_needed(self):
-        """Reconnect to Quotex if connection is lost"""
+        """
+        Reconnect to Quotex if connection is lost
+        Failed attempts open a circuit breaker that skips reconnects for a jittered,
+        exponentially growing period (capped at 60s) instead of retrying inline
+        """
+        if time.time() < self._breaker_open_until:
+            return
+        
         try:
-            if not self.quotex_client or not await self.quotex_client.check_connect():
+            if not self._quotex_connected():
                 logger.warning("Connection lost, attempting to reconnect...")
-                if await self.init_quotex():
+                if await self.init_quotex(max_retries=1):
                     logger.info("Reconnection successful")
+                    self._reconnect_failures = 0
                 else:
-                    logger.error("Reconnection failed")
+                    self._reconnect_failures += 1
+                    backoff = min(60, 2 ** self._reconnect_failures) * random.uniform(0.8, 1.2)
+                    self._breaker_open_until = time.time() + backoff
+                    logger.error(f"Reconnection failed, next attempt in {backoff:.1f} seconds")
         except Exception as e:
             logger.error(f"Error during reconnection check: {e}")
     
     async def run(self):
-        """Main bot loop - sequential analysis of all pairs"""
-        logger.info("Starting Telegram OTC Bot - REDOX v10.1 (Sequential Mode)")
+        """Main bot loop - concurrent scan of all pairs"""
+        logger.info("Starting Telegram OTC Bot - REDOX v10.1 (Concurrent Scan Mode)")
         
         # Test Telegram connection
+        if self.use_mtproto:
+            await self.bot.start()
         if self.telegram_token:
             await self.test_telegram()
         
+        # Start batched Telegram sender
+        if self.bot and self.chat_id:
+            self._flusher = asyncio.create_task(self._flush_loop())
+        
         # Initialize Quotex connection
         if not await self.init_quotex():
             logger.error("Failed to initialize Quotex connection")
             return
         
-        logger.info(f"Sequential monitoring of {len(self.OTC_PAIRS)} OTC pairs")
-        
+        logger.info(f"Concurrent monitoring of {len(self.OTC_PAIRS)} OTC pairs")
+        await self.scan_loop()
+    
+    async def scan_loop(self):
+        """Scan all idle pairs every SCAN_INTERVAL and start a sequence per signal"""
         while True:
+            cycle_start = time.time()
             try:
                 # Check connection health
                 await self.reconnect_if_needed()
                 
-                # Loop through all pairs sequentially
-                for pair in self.OTC_PAIRS:
-                    try:
-                        logger.info(f"Analyzing pair: {pair}")
-                        
-                        # Analyze single pair
-                        result = await self.analyze_single_pair(pair)
-                        
-                        if result:
-                            pair_name, direction, score, price = result
-                            message = self.format_message(pair_name, direction, price)
-                            
-                            # Send signal
-                            if await self.send_telegram(message):
-                                logger.info(f"Signal sent for {pair} - {direction} at {price}")
-                                
-                                # Log signal
-                                signal_log = f"{pair} {direction} signal at {price}"
-                                self.log_signal(signal_log)
-                                
-                                # Evaluate result (this will take ~2 minutes)
-                                await self.evaluate_signal_result(pair, direction)
-                            else:
-                                logger.error(f"Failed to send signal for {pair}")
-                        else:
-                            logger.info(f"No signal generated for {pair} (low volatility or no data)")
-                        
-                        # Small delay between pairs
-                        await asyncio.sleep(2)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing pair {pair}: {e}")
-                        continue
+                # Pairs with a running sequence are skipped until it completes
+                pairs = [pair for pair in self.OTC_PAIRS if pair not in self._open_trades]
+                
+                # Fetch all pairs concurrently, then score them in one batch
+                scan_results = await asyncio.gather(
+                    *(self._scan_pair(pair) for pair in pairs),
+                    return_exceptions=True
+                )
                 
-                # Completed all pairs, small delay before next cycle
-                logger.info("Completed analysis of all pairs. Starting next cycle...")
-                await asyncio.sleep(5)
+                fetched = []
+                for pair, scanned in zip(pairs, scan_results):
+                    if isinstance(scanned, BaseException):
+                        logger.error(f"Error processing pair {pair}: {scanned}")
+                    else:
+                        fetched.append(scanned)
+                
+                # Dispatch signals in pair order, all entering on the next minute
+                entry_ts = int(time.time()) // 60 * 60 + 60
+                for pair, result in self.analyze_pairs(fetched):
+                    if not result:
+                        logger.info(f"No signal generated for {pair} (low volatility or no data)")
+                    elif len(self._open_trades) >= self.MAX_OPEN_TRADES:
+                        logger.info(f"Skipping signal for {pair}: {self.MAX_OPEN_TRADES} sequences running")
+                    else:
+                        result = await self._refresh_signal(pair)
+                        if result is None:
+                            logger.info(f"Signal for {pair} dropped after refreshing stale candles")
+                            continue
+                        pair_name, direction, score, price = result
+                        self._start_trade_sequence(pair_name, direction, price, entry_ts)
+                
+                # Completed all pairs, wait for the next scan slot
+                logger.info("Completed analysis of all pairs. Waiting for next cycle...")
+                await self._sleep_until(cycle_start + self.SCAN_INTERVAL)
                 
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
@@ -522,8 +878,26 @@ async def main():
     except Exception as e:
         logger.error(f"Bot crashed: {e}")
     finally:
+        if bot._flusher:
+            bot._flusher.cancel()
+            while not bot._tg_queue.empty():
+                await bot._flush_telegram()
+        if bot.use_mtproto:
+            if bot.bot.is_connected:
+                await bot.bot.stop()
+        elif bot.bot:
+            await bot.bot.shutdown()
+        if bot._log_fp:
+            bot._log_fp.close()
         if bot.quotex_client:
             await bot.quotex_client.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        # Faster event loop for the WebSocket/HTTPS traffic; not available on Windows,
+        # where the default asyncio loop is used instead
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
@@ -1,30 +1,73 @@
 #!/usr/bin/env python3
 """
 Fixed Telegram OTC Bot for PyQuotex - REDOX v10.1
-Sequential monitoring with reversal logic
+Concurrent monitoring of all pairs with reversal logic
 """
 
 import os
 import time
+import queue
 import asyncio
 import logging
+import logging.handlers
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
+import numpy as np
 from telegram import Bot
+from telegram.request import HTTPXRequest
 from dotenv import load_dotenv
+from pyquotex import global_value
 from pyquotex.stable_api import Quotex
 
+try:
+    from numba import njit
+except ImportError:  # reversal detection falls back to plain NumPy
+    njit = None
+
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Records are queued on the calling thread and written by the listener thread
+_log_records: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_records, _log_stream)
+_log_listener.start()
+_log_queue_handler = logging.handlers.QueueHandler(_log_records)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _reversal_kernel_numpy(oc: np.ndarray) -> np.ndarray:
+    # oc is (N, k) close - open; +1 means PUT (run of up candles), -1 CALL, 0 no signal
+    signs = np.sign(oc)
+    uniform = np.all(signs == signs[:, :1], axis=1) & (signs[:, 0] != 0)
+    return np.where(uniform, signs[:, 0], 0).astype(np.int8)
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _analyze_reversal_batch(oc):
+        # Compiled equivalent of _reversal_kernel_numpy
+        n, k = oc.shape
+        out = np.zeros(n, dtype=np.int8)
+        for i in range(n):
+            s0 = np.sign(oc[i, 0])
+            if s0 == 0:
+                continue
+            uniform = True
+            for j in range(1, k):
+                if np.sign(oc[i, j]) != s0:
+                    uniform = False
+                    break
+            if uniform:
+                out[i] = np.int8(s0)
+        return out
+else:
+    _analyze_reversal_batch = _reversal_kernel_numpy
+
+@dataclass(slots=True, frozen=True)
 class CandleData:
     open: float
     high: float
@@ -32,34 +75,126 @@ class CandleData:
     close: float
     timestamp: int
 
+_OTC_PAIRS: Tuple[str, ...] = (
+    "AUDNZD_otc", "AXP_otc", "BA_otc", "BRLUSD_otc", "BTCUSD_otc", 
+    "CADCHF_otc", "EURNZD_otc", "FB_otc", "NZDCAD_otc", "NZDCHF_otc", 
+    "NZDJPY_otc", "PFE_otc", "UKBrent_otc", "USCrude_otc", "USDARS_otc", 
+    "USDBDT_otc", "USDCOP_otc", "USDDZD_otc", "USDEGP_otc", "USDIDR_otc", 
+    "USDINR_otc", "USDJPY_otc", "USDMXN_otc", "USDNGN_otc", "USDPHP_otc", 
+    "USDPKR_otc", "USDTRY_otc", "USDZAR_otc", "XAGUSD_otc", "XAUUSD_otc"
+)
+
+_PAIR_NAMES = MappingProxyType({
+    "AUDNZD_otc": "AUD/NZD", "AXP_otc": "American Express", "BA_otc": "Boeing",
+    "BRLUSD_otc": "USD/BRL", "BTCUSD_otc": "Bitcoin", "CADCHF_otc": "CAD/CHF",
+    "EURNZD_otc": "EUR/NZD", "FB_otc": "Facebook", "NZDCAD_otc": "NZD/CAD",
+    "NZDCHF_otc": "NZD/CHF", "NZDJPY_otc": "NZD/JPY", "PFE_otc": "Pfizer",
+    "UKBrent_otc": "UK Brent", "USCrude_otc": "US Crude", "USDARS_otc": "USD/ARS",
+    "USDBDT_otc": "USD/BDT", "USDCOP_otc": "USD/COP", "USDDZD_otc": "USD/DZD",
+    "USDEGP_otc": "USD/EGP", "USDIDR_otc": "USD/IDR", "USDINR_otc": "USD/INR",
+    "USDJPY_otc": "USD/JPY", "USDMXN_otc": "USD/MXN", "USDNGN_otc": "USD/NGN",
+    "USDPHP_otc": "USD/PHP", "USDPKR_otc": "USD/PKR", "USDTRY_otc": "USD/TRY",
+    "USDZAR_otc": "USD/ZAR", "XAGUSD_otc": "Silver", "XAUUSD_otc": "Gold"
+})
+
+@dataclass(slots=True, frozen=True)
+class BotConfig:
+    telegram_token: str = field(repr=False)
+    chat_id: str
+    # Seconds between scan cycle starts
+    cycle_seconds: float = 30.0
+    # Max candle fetches in flight during a scan
+    parallelism: int = 8
+    mg_enabled: bool = True
+    
+    def __post_init__(self):
+        # A zero-permit semaphore would hang the scan, and a non-positive cycle would never idle
+        if self.parallelism < 1 or not self.cycle_seconds > 0:
+            raise ValueError(
+                f"BotConfig needs parallelism >= 1 and cycle_seconds > 0, "
+                f"got parallelism={self.parallelism}, cycle_seconds={self.cycle_seconds}"
+            )
+    
+    @classmethod
+    def from_env(cls) -> "BotConfig":
+        token = os.getenv('TELEGRAM_TOKEN', '')
+        chat_id = os.getenv('TELEGRAM_CHAT_ID', '')
+        if not (token and chat_id) and os.getenv('ALLOW_NO_TELEGRAM') != '1':
+            raise RuntimeError(
+                "TELEGRAM_TOKEN and TELEGRAM_CHAT_ID must be set (set ALLOW_NO_TELEGRAM=1 to only log signals)"
+            )
+        return cls(
+            telegram_token=token,
+            chat_id=chat_id,
+            cycle_seconds=float(os.getenv('CYCLE_SECONDS', '30')),
+            parallelism=int(os.getenv('SCAN_PARALLELISM', '8')),
+            mg_enabled=os.getenv('MG_ENABLED', '1') != '0'
+        )
+
+# Static signal header per pair, built once at import
+_PAIR_PREFIX = MappingProxyType({
+    p: f"======== REDOX v10.1 ========\nPAIR: {_PAIR_NAMES.get(p, p)}\n" for p in _OTC_PAIRS
+})
+
 class TelegramOTCBot:
-    OTC_PAIRS = [
-        "AUDNZD_otc", "AXP_otc", "BA_otc", "BRLUSD_otc", "BTCUSD_otc", 
-        "CADCHF_otc", "EURNZD_otc", "FB_otc", "NZDCAD_otc", "NZDCHF_otc", 
-        "NZDJPY_otc", "PFE_otc", "UKBrent_otc", "USCrude_otc", "USDARS_otc", 
-        "USDBDT_otc", "USDCOP_otc", "USDDZD_otc", "USDEGP_otc", "USDIDR_otc", 
-        "USDINR_otc", "USDJPY_otc", "USDMXN_otc", "USDNGN_otc", "USDPHP_otc", 
-        "USDPKR_otc", "USDTRY_otc", "USDZAR_otc", "XAGUSD_otc", "XAUUSD_otc"
-    ]
-    
-    PAIR_NAMES = {
-        "AUDNZD_otc": "AUD/NZD", "AXP_otc": "American Express", "BA_otc": "Boeing",
-        "BRLUSD_otc": "USD/BRL", "BTCUSD_otc": "Bitcoin", "CADCHF_otc": "CAD/CHF",
-        "EURNZD_otc": "EUR/NZD", "FB_otc": "Facebook", "NZDCAD_otc": "NZD/CAD",
-        "NZDCHF_otc": "NZD/CHF", "NZDJPY_otc": "NZD/JPY", "PFE_otc": "Pfizer",
-        "UKBrent_otc": "UK Brent", "USCrude_otc": "US Crude", "USDARS_otc": "USD/ARS",
-        "USDBDT_otc": "USD/BDT", "USDCOP_otc": "USD/COP", "USDDZD_otc": "USD/DZD",
-        "USDEGP_otc": "USD/EGP", "USDIDR_otc": "USD/IDR", "USDINR_otc": "USD/INR",
-        "USDJPY_otc": "USD/JPY", "USDMXN_otc": "USD/MXN", "USDNGN_otc": "USD/NGN",
-        "USDPHP_otc": "USD/PHP", "USDPKR_otc": "USD/PKR", "USDTRY_otc": "USD/TRY",
-        "USDZAR_otc": "USD/ZAR", "XAGUSD_otc": "Silver", "XAUUSD_otc": "Gold"
-    }
-    
-    def __init__(self):
-        self.telegram_token = os.getenv('TELEGRAM_TOKEN')
-        self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        self.bot = Bot(token=self.telegram_token) if self.telegram_token else None
+    OTC_PAIRS = _OTC_PAIRS
+    PAIR_NAMES = _PAIR_NAMES
+    
+    # Pairs failing to return data this many times in a row are skipped for NODATA_SKIP seconds
+    NODATA_MAX_FAILS = 3
+    NODATA_SKIP = 300
+    # Telegram sender: Bot API rate (msg/s), coalescing window (s), queue bound, text limit
+    TG_RATE_LIMIT = 30
+    TG_COALESCE_WINDOW = 0.2
+    TG_QUEUE_SIZE = 100
+    TG_MAX_LENGTH = 4096
+    # Seconds after a candle closes before its final OHLC is fetched
+    CANDLE_CLOSE_BUFFER = 5
+    # Seconds to wait for a Quotex candle response
+    QUOTEX_TIMEOUT = 15
+    # Seconds a fetched candle window is shared with later callers in the same minute
+    CANDLE_CACHE_TTL = 10
+    # Persistent HTTP/2 pool for Bot API calls
+    TG_CONNECTION_POOL_SIZE = 16
+    
+    def __init__(self, cfg: Optional[BotConfig] = None):
+        self.cfg = cfg or BotConfig.from_env()
+        self.bot = Bot(
+            token=self.cfg.telegram_token,
+            request=HTTPXRequest(
+                http_version="2",
+                connection_pool_size=self.TG_CONNECTION_POOL_SIZE,
+                connect_timeout=5,
+                read_timeout=10
+            )
+        ) if self.cfg.telegram_token and self.cfg.chat_id else None
         self.quotex_client = None
+        self._scan_semaphore = asyncio.Semaphore(self.cfg.parallelism)
+        # Quotex.get_candles has a single response slot, so calls must not interleave
+        self._quotex_lock = asyncio.Lock()
+        # Consecutive failed reconnects, drives the reconnect backoff
+        self._fail_count = 0
+        # Running result evaluations by pair; holding the task keeps it from being GC'd
+        self._pending_evals: Dict[str, asyncio.Task] = {}
+        
+        # Negative cache for pairs that keep returning no data
+        self._nodata_until: Dict[str, float] = {}
+        self._nodata_fail: Dict[str, int] = {}
+        
+        # Outgoing (chat_id, text) pairs for the rate-limited Telegram sender
+        self._tg_queue: asyncio.Queue = asyncio.Queue(maxsize=self.TG_QUEUE_SIZE)
+        self._tg_task: Optional[asyncio.Task] = None
+        # Message the sender is coalescing or sending, and the one it held back for the next
+        # send; kept here so shutdown can still log them
+        self._tg_current: Optional[Tuple[str, str]] = None
+        self._tg_carry: Optional[Tuple[str, str]] = None
+        
+        # (timestamp, message) entries for signals.log, appended in batches by the log writer task
+        self._log_queue: asyncio.Queue = asyncio.Queue()
+        self._log_task: Optional[asyncio.Task] = None
+        
+        # Shared candle fetches keyed by (pair, count, minute)
+        self._candle_inflight: Dict[Tuple[str, int, int], asyncio.Future] = {}
         
     async def init_quotex(self) -> bool:
         try:
@@ -69,27 +204,102 @@ class TelegramOTCBot:
                 logger.info("Connected to Quotex")
                 return True
             else:
-                logger.error(f"Quotex connection failed: {reason}")
+                logger.error("Quotex connection failed: %s", reason)
                 return False
         except Exception as e:
-            logger.error(f"Quotex init error: {e}")
+            logger.error("Quotex init error: %s", e)
             return False
     
-    async def get_candles(self, pair: str, count: int = 4) -> Optional[List[CandleData]]:
+    def _quotex_connected(self) -> bool:
+        # Websocket state kept by pyquotex's ws client; Quotex.check_connect() sleeps 2s and
+        # only reflects authorization, which is not cleared when the socket drops
+        return self.quotex_client is not None and global_value.check_websocket_if_connect == 1
+    
+    async def _reconnect(self) -> bool:
+        backoff = min(60, 2 ** self._fail_count)
+        logger.warning("Quotex connection lost, reconnecting in %ds...", backoff)
+        await asyncio.sleep(backoff)
+        
         try:
-            if not self.quotex_client:
-                return None
-            
+            # Reuse the client so its saved session token skips re-authentication
+            if self.quotex_client is None:
+                self.quotex_client = Quotex()
+            # Not under _quotex_lock: a fetch stuck on the dead socket must not block recovery
+            success, reason = await self.quotex_client.connect()
+        except Exception as e:
+            success, reason = False, e
+        
+        if success:
+            logger.info("Reconnected to Quotex")
+            self._fail_count = 0
+        else:
+            logger.error("Quotex reconnect failed: %s", reason)
+            self._fail_count += 1
+        return success
+    
+    async def _drop_session(self):
+        # Marked down even if close() fails, so run() reconnects before its next scan
+        try:
+            await self.quotex_client.close()
+        except Exception as e:
+            logger.error("Error closing Quotex session: %s", e)
+        global_value.check_websocket_if_connect = 0
+    
+    async def get_candles(self, pair: str, count: int = 4, end_time: Optional[float] = None) -> Optional[List[CandleData]]:
+        if end_time is None:
             end_time = time.time()
+        
+        # Single-flight: requests for the same pair, count and minute share one fetch,
+        # and a successful result is reused for CANDLE_CACHE_TTL seconds
+        key = (pair, count, int(end_time // 60))
+        fut = self._candle_inflight.get(key)
+        if fut is not None:
+            return await asyncio.shield(fut)
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._candle_inflight[key] = fut
+        candles = None
+        try:
+            candles = await self._fetch_candles(pair, count, end_time)
+            return candles
+        finally:
+            if not fut.done():
+                fut.set_result(candles)
+            if candles:
+                asyncio.get_running_loop().call_later(
+                    self.CANDLE_CACHE_TTL, self._candle_inflight.pop, key, None
+                )
+            else:
+                self._candle_inflight.pop(key, None)
+    
+    async def _fetch_candles(self, pair: str, count: int, end_time: float) -> Optional[List[CandleData]]:
+        try:
             offset = count * 60
             
-            candles_raw = await self.quotex_client.get_candles(
-                asset=pair,
-                end_from_time=end_time,
-                offset=offset,
-                period=60
-            )
+            async with self._quotex_lock:
+                # Checked under the lock: a fetch that timed out ahead of this one drops the session
+                if not self._quotex_connected():
+                    return None
+                try:
+                    # Quotex.get_candles polls forever if the socket drops mid-request
+                    candles_raw = await asyncio.wait_for(
+                        self.quotex_client.get_candles(
+                            asset=pair,
+                            end_from_time=end_time,
+                            offset=offset,
+                            period=60
+                        ),
+                        timeout=self.QUOTEX_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    # The abandoned request can still be answered into the client's single
+                    # candle slot; close the socket so no later fetch reads that response
+                    logger.warning("Timed out getting candles for %s, dropping the Quotex session", pair)
+                    await self._drop_session()
+                    return None
             
+            # Candles opening at or after end_time lie outside the requested window
+            candles_raw = [c for c in candles_raw or [] if c.get('time', 0) < end_time]
             if not candles_raw:
                 return None
             
@@ -106,69 +316,178 @@ class TelegramOTCBot:
             return candles
             
         except Exception as e:
-            logger.error(f"Error getting candles for {pair}: {e}")
+            logger.error("Error getting candles for %s: %s", pair, e)
+            return None
+    
+    async def _result_candles(self, pair: str, first_ts: int, count: int) -> Optional[List[CandleData]]:
+        # `count` consecutive closed candles starting at first_ts, from one request for the
+        # window ending where the last of them closes
+        candles = await self.get_candles(pair, count, end_time=first_ts + 60 * count)
+        if not candles:
+            return None
+        
+        # Match by timestamp; a minute the fetch did not cover can't be graded
+        fetched = {c.timestamp: c for c in candles}
+        found = [fetched.get(first_ts + 60 * i) for i in range(count)]
+        return None if None in found else found
+    
+    async def _fetch_scan_candles(self, pair: str, end_time: float) -> Optional[List[CandleData]]:
+        async with self._scan_semaphore:
+            return await self.get_candles(pair, 4, end_time=end_time)
+    
+    async def _refresh_signal(self, pair: str, cycle_end_time: float) -> Optional[Tuple[str, float]]:
+        # Scan fetches are serialized, so early pairs of a long scan fall behind the market.
+        # Re-request right before dispatch: the single-flight cache answers while the
+        # scan's window is under CANDLE_CACHE_TTL old, otherwise Quotex is asked again
+        now = time.time()
+        if int(now // 60) != int(cycle_end_time // 60):
+            # The scanned forming candle has closed; the next cycle rescans the pair
             return None
+        candles = await self._fetch_scan_candles(pair, now)
+        if not candles:
+            return None
+        return self.analyze_reversal(candles[-4:])
+    
+    def _record_nodata(self, pair: str):
+        fails = self._nodata_fail.get(pair, 0) + 1
+        if fails >= self.NODATA_MAX_FAILS:
+            logger.info("Skipping %s for %ds after %d empty fetches", pair, self.NODATA_SKIP, fails)
+            self._nodata_until[pair] = time.time() + self.NODATA_SKIP
+            fails = 0
+        self._nodata_fail[pair] = fails
     
     def analyze_reversal(self, candles: List[CandleData]) -> Optional[Tuple[str, float]]:
         if len(candles) < 4:
             return None
         
-        # Check if last 4 candles are same direction
-        directions = []
-        for candle in candles:
-            if candle.close > candle.open:
-                directions.append("CALL")
-            elif candle.close < candle.open:
-                directions.append("PUT")
-            else:
-                directions.append("NEUTRAL")
+        # Pack 2 bits per candle (01 up, 10 down, 00 flat) and compare against the first
+        # candle's code repeated; most pairs fail within the first couple of candles
+        first = candles[0]
+        code = 1 if first.close > first.open else 2 if first.close < first.open else 0
+        if not code:
+            return None
         
-        # If all 4 candles are same direction, predict reversal
-        if len(set(directions)) == 1 and directions[0] != "NEUTRAL":
-            reversal_direction = "PUT" if directions[0] == "CALL" else "CALL"
-            return reversal_direction, candles[-1].close
+        mask = want = code
+        for candle in candles[1:]:
+            mask = (mask << 2) | (1 if candle.close > candle.open else 2 if candle.close < candle.open else 0)
+            want = (want << 2) | code
+            if mask != want:
+                return None
         
-        return None
+        # If all candles are same direction (0b0101... up, 0b1010... down), predict reversal
+        return "PUT" if code == 1 else "CALL", candles[-1].close
     
-    def format_signal(self, pair: str, direction: str, price: float) -> str:
-        name = self.PAIR_NAMES.get(pair, pair)
-        time_str = (datetime.now() + timedelta(minutes=1)).strftime("%H:%M")
+    def analyze_reversal_batch(self, pairs: List[str],
+                               candle_sets: List[List[CandleData]]) -> List[Tuple[str, str, float]]:
+        # Vectorized analyze_reversal over the last 4 candles of each pair
+        if not candle_sets:
+            return []
+        
+        oc = np.array([[c.close - c.open for c in candles[-4:]] for candles in candle_sets], dtype=np.float64)
+        signals = _analyze_reversal_batch(oc)
+        
+        return [
+            (pairs[i], "PUT" if signals[i] > 0 else "CALL", candle_sets[i][-1].close)
+            for i in np.flatnonzero(signals)
+        ]
+    
+    def format_signal(self, pair: str, direction: str, price: float, time_str: Optional[str] = None) -> str:
+        prefix = _PAIR_PREFIX.get(pair) or f"======== REDOX v10.1 ========\nPAIR: {pair}\n"
+        if time_str is None:
+            time_str = (datetime.now() + timedelta(minutes=1)).strftime("%H:%M")
         color = "[GREEN]" if direction == "CALL" else "[RED]"
         
-        return f"""======== REDOX v10.1 ========
-PAIR: {name}
-TIME: {time_str}
-DIRECTION: {color} {direction}
-PRICE: {price:.5f}
-EXPIRY: M1
-============================="""
+        return f"{prefix}TIME: {time_str}\nDIRECTION: {color} {direction}\nPRICE: {price:.5f}\nEXPIRY: M1\n============================="
     
     async def send_message(self, message: str) -> bool:
         print(f"\n{message}\n")
         
-        if self.bot and self.chat_id:
+        if self.bot:
             try:
-                await self.bot.send_message(chat_id=self.chat_id, text=message)
-                logger.info("Message sent to Telegram")
+                self._tg_queue.put_nowait((self.cfg.chat_id, message))
                 return True
-            except Exception as e:
-                logger.error(f"Telegram send error: {e}")
+            except asyncio.QueueFull:
+                logger.warning("Telegram queue full, message logged to file only")
+        
+        # Log to file (formatted and written by the log writer task)
+        self._log_queue.put_nowait((time.time(), message))
+        
+        return True
+    
+    async def _tg_sender(self):
+        # Token bucket keeps sends under the Bot API rate; messages to the same chat
+        # arriving within TG_COALESCE_WINDOW are joined into one send
+        loop = asyncio.get_running_loop()
+        tokens = float(self.TG_RATE_LIMIT)
+        updated = loop.time()
         
-        # Log to file
+        while True:
+            chat_id, text = self._tg_carry or await self._tg_queue.get()
+            self._tg_carry = None
+            self._tg_current = (chat_id, text)
+            await asyncio.sleep(self.TG_COALESCE_WINDOW)
+            while not self._tg_queue.empty():
+                next_chat_id, next_text = self._tg_queue.get_nowait()
+                if next_chat_id != chat_id or len(text) + 2 + len(next_text) > self.TG_MAX_LENGTH:
+                    self._tg_carry = (next_chat_id, next_text)
+                    break
+                text = f"{text}\n\n{next_text}"
+                self._tg_current = (chat_id, text)
+            
+            now = loop.time()
+            tokens = min(float(self.TG_RATE_LIMIT), tokens + (now - updated) * self.TG_RATE_LIMIT)
+            updated = now
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / self.TG_RATE_LIMIT)
+                tokens = 1.0
+                updated = loop.time()
+            tokens -= 1
+            
+            try:
+                await self.bot.send_message(chat_id=chat_id, text=text)
+                logger.info("Message sent to Telegram")
+            except Exception as e:
+                logger.error("Telegram send error: %s", e)
+                self._log_queue.put_nowait((time.time(), text))
+            self._tg_current = None
+    
+    def _append_log(self, text: str):
         try:
             with open("signals.log", "a", encoding="utf-8") as f:
-                f.write(f"{datetime.now().isoformat()} - {message}\n\n")
+                f.write(text)
         except Exception as e:
-            logger.error(f"Log error: {e}")
-        
-        return True
+            logger.error("Log error: %s", e)
+    
+    @staticmethod
+    def _format_log_entry(entry: Tuple[float, str]) -> str:
+        ts, message = entry
+        return f"{datetime.fromtimestamp(ts).isoformat()} - {message}\n\n"
+    
+    def _drain_log_queue(self) -> str:
+        lines = []
+        while not self._log_queue.empty():
+            lines.append(self._format_log_entry(self._log_queue.get_nowait()))
+        return "".join(lines)
+    
+    async def _log_writer(self):
+        # One append per burst of queued lines, off the event loop thread
+        while True:
+            first = self._format_log_entry(await self._log_queue.get())
+            await asyncio.to_thread(self._append_log, first + self._drain_log_queue())
     
-    async def evaluate_result(self, pair: str, direction: str) -> str:
-        logger.info(f"Waiting 60s to evaluate {pair} {direction}...")
-        await asyncio.sleep(60)
+    async def evaluate_result(self, pair: str, direction: str, signal_time: Optional[float] = None) -> str:
+        if signal_time is None:
+            signal_time = time.time()
+        # The entry minute announced with the signal (the one after it fired), then the following minute for MG
+        first_ts = int(signal_time // 60) * 60 + 60
         
-        # Check first candle
-        candles = await self.get_candles(pair, 1)
+        # The signal candle and the MG candle (if enabled) come from one fetch after they close
+        count = 2 if self.cfg.mg_enabled else 1
+        wait = max(0.0, first_ts + 60 * count + self.CANDLE_CLOSE_BUFFER - time.time())
+        logger.info("Waiting %ds to evaluate %s %s...", wait, pair, direction)
+        await asyncio.sleep(wait)
+        
+        candles = await self._result_candles(pair, first_ts, count)
         if not candles:
             return "ERROR"
         
@@ -176,64 +495,116 @@ EXPIRY: M1
         if (direction == "CALL" and candle.close > candle.open) or \
            (direction == "PUT" and candle.close < candle.open):
             return "WIN"
-        
-        # Check second candle for MG WIN
-        logger.info(f"Checking MG for {pair}...")
-        await asyncio.sleep(60)
-        
-        candles = await self.get_candles(pair, 1)
-        if not candles:
+        if not self.cfg.mg_enabled:
             return "LOSS"
         
-        candle = candles[0]
-        if (direction == "CALL" and candle.close > candle.open) or \
-           (direction == "PUT" and candle.close < candle.open):
+        # Check second candle for MG WIN
+        mg_candle = candles[1]
+        if (direction == "CALL" and mg_candle.close > mg_candle.open) or \
+           (direction == "PUT" and mg_candle.close < mg_candle.open):
             return "MG WIN"
         
         return "LOSS"
     
+    async def _evaluate_and_report(self, pair: str, direction: str, signal_time: float):
+        result_status = await self.evaluate_result(pair, direction, signal_time)
+        result_msg = f"RESULT: {_PAIR_NAMES.get(pair, pair)} -> {result_status}"
+        await self.send_message(result_msg)
+        
+        logger.info("Result: %s %s -> %s", pair, direction, result_status)
+    
+    def _on_eval_done(self, pair: str, task: asyncio.Task):
+        self._pending_evals.pop(pair, None)
+        if not task.cancelled() and task.exception():
+            logger.error("Evaluation error for %s: %s", pair, task.exception())
+    
     async def run(self):
         logger.info("Starting REDOX Bot v10.1")
+        self._log_task = asyncio.create_task(self._log_writer())
+        if self.bot:
+            self._tg_task = asyncio.create_task(self._tg_sender())
         
         if not await self.init_quotex():
             logger.error("Failed to connect to Quotex")
             return
         
+        # Cycles start every cfg.cycle_seconds on the monotonic loop clock,
+        # however long the scan itself took
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        
         while True:
             try:
-                for pair in self.OTC_PAIRS:
-                    logger.info(f"Analyzing {pair}...")
-                    
-                    candles = await self.get_candles(pair, 4)
-                    if not candles:
-                        logger.info(f"No data for {pair}")
+                # Don't scan on a dead socket; every pair would count as no-data
+                if not self._quotex_connected():
+                    await self._reconnect()
+                    next_tick = loop.time()
+                    continue
+                
+                # One clock read per cycle serves the candle window, the
+                # no-data check and the signal entry time
+                cycle_end_time = time.time()
+                time_str = (datetime.fromtimestamp(cycle_end_time) + timedelta(minutes=1)).strftime("%H:%M")
+                
+                # Pairs still being evaluated would repeat the same signal,
+                # and pairs in the no-data cache would waste a round-trip
+                pairs = [
+                    pair for pair in _OTC_PAIRS
+                    if pair not in self._pending_evals and cycle_end_time >= self._nodata_until.get(pair, 0)
+                ]
+                
+                # Fetch every pair concurrently, then analyze in pair order
+                results = await asyncio.gather(
+                    *[self._fetch_scan_candles(pair, cycle_end_time) for pair in pairs],
+                    return_exceptions=True
+                )
+                
+                # Pairs that came back empty because the session was dropped mid-scan
+                # are not counted against the pair
+                connected = self._quotex_connected()
+                scanned_pairs, candle_sets = [], []
+                for pair, candles in zip(pairs, results):
+                    if isinstance(candles, BaseException):
+                        logger.error("Error getting candles for %s: %s", pair, candles)
+                        self._record_nodata(pair)
+                    elif not candles:
+                        logger.info("No data for %s", pair)
+                        if connected:
+                            self._record_nodata(pair)
+                    else:
+                        self._nodata_fail.pop(pair, None)
+                        if len(candles) >= 4:
+                            scanned_pairs.append(pair)
+                            candle_sets.append(candles)
+                
+                signals = self.analyze_reversal_batch(scanned_pairs, candle_sets)
+                logger.info("Reversal patterns found: %d/%d pairs", len(signals), len(scanned_pairs))
+                
+                for pair, _, _ in signals:
+                    refreshed = await self._refresh_signal(pair, cycle_end_time)
+                    if refreshed is None:
+                        logger.info("Signal for %s dropped after refreshing its candles", pair)
                         continue
+                    direction, price = refreshed
+                    signal_msg = self.format_signal(pair, direction, price, time_str)
                     
-                    result = self.analyze_reversal(candles)
-                    if result:
-                        direction, price = result
-                        signal_msg = self.format_signal(pair, direction, price)
+                    if await self.send_message(signal_msg):
+                        logger.info("Signal sent: %s %s", pair, direction)
                         
-                        if await self.send_message(signal_msg):
-                            logger.info(f"Signal sent: {pair} {direction}")
-                            
-                            # Evaluate result
-                            result_status = await self.evaluate_result(pair, direction)
-                            result_msg = f"RESULT: {self.PAIR_NAMES.get(pair, pair)} -> {result_status}"
-                            await self.send_message(result_msg)
-                            
-                            logger.info(f"Result: {pair} {direction} -> {result_status}")
-                    else:
-                        logger.info(f"No reversal pattern for {pair}")
-                    
-                    await asyncio.sleep(1)  # Small delay between pairs
+                        # Evaluate result in the background
+                        task = asyncio.create_task(self._evaluate_and_report(pair, direction, cycle_end_time))
+                        self._pending_evals[pair] = task
+                        task.add_done_callback(lambda t, p=pair: self._on_eval_done(p, t))
                 
                 logger.info("Cycle complete, restarting...")
-                await asyncio.sleep(5)
+                # An overrunning cycle is followed immediately rather than by a catch-up burst
+                next_tick = max(next_tick + self.cfg.cycle_seconds, loop.time())
+                await asyncio.sleep(next_tick - loop.time())
                 
             except Exception as e:
-                logger.error(f"Main loop error: {e}")
+                logger.error("Main loop error: %s", e)
                 await asyncio.sleep(10)
+                next_tick = loop.time()
 
 async def main():
     bot = TelegramOTCBot()
@@ -242,10 +613,34 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Bot stopped")
     except Exception as e:
-        logger.error(f"Bot error: {e}")
+        logger.error("Bot error: %s", e)
     finally:
+        if bot._tg_task:
+            bot._tg_task.cancel()
+        # Unsent Telegram messages still reach signals.log, in order: the one being
+        # sent (it may already have been delivered), the held-back one, then the queue
+        for pending in (bot._tg_current, bot._tg_carry):
+            if pending:
+                bot._log_queue.put_nowait((time.time(), pending[1]))
+        while not bot._tg_queue.empty():
+            _, text = bot._tg_queue.get_nowait()
+            bot._log_queue.put_nowait((time.time(), text))
+        if bot._log_task:
+            bot._log_task.cancel()
+        pending_log = bot._drain_log_queue()
+        if pending_log:
+            bot._append_log(pending_log)
+        if bot.bot:
+            await bot.bot.shutdown()
         if bot.quotex_client:
             await bot.quotex_client.close()
+        # Flush queued log records
+        _log_listener.stop()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop  # optional, not available on Windows
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file